@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List
 from dataclasses import dataclass
 
@@ -19,6 +20,42 @@ class Task:
     duration: int
     reward: int
 
+@dataclass(eq=False)
+class Tasks:
+    """
+    A collection of tasks stored as parallel arrays (structure of arrays).
+
+    Indexing returns an individual Task, so Tasks can be used in place of a list of tasks.
+
+    Attributes
+    ----------
+    deadline : np.ndarray
+        The latest possible completion times of the tasks.
+    duration : np.ndarray
+        The times required to complete the tasks.
+    reward : np.ndarray
+        The rewards for completing the tasks on time.
+    """
+    deadline: np.ndarray
+    duration: np.ndarray
+    reward: np.ndarray
+
+    @classmethod
+    def from_list(cls, tasks: List[Task]) -> "Tasks":
+        """
+        Creates a collection of tasks from a list of Task objects.
+        """
+        data = np.array([(task.deadline, task.duration, task.reward) for task in tasks])
+        deadline, duration, reward = np.ascontiguousarray(data.reshape(-1, 3).T)
+        return cls(deadline=deadline, duration=duration, reward=reward)
+
+    def __len__(self) -> int:
+        return len(self.deadline)
+
+    def __getitem__(self, index: int) -> Task:
+        return Task(deadline=self.deadline[index].item(), duration=self.duration[index].item(),
+                    reward=self.reward[index].item())
+
 @dataclass
 class ScheduleItem:
     """
@@ -49,7 +86,7 @@ class Schedule:
     total_reward : int
         The total reward obtained from completing tasks on time.
     status : str
-        Status returned by CVXPY solver: optimal, infeasible, unbounded, optimal_inaccurate, user_limit, solver_error, etc.
+        Solver status in CVXPY notation: optimal, infeasible, unbounded, optimal_inaccurate, user_limit, solver_error, etc.
     """
     items: List[ScheduleItem]
     total_reward: int
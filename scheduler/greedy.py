@@ -0,0 +1,121 @@
+import functools
+import heapq
+import numpy as np
+
+# Smallest number of tasks for which the compiled kernel is used. Below it the cost of
+# loading the kernel outweighs the speedup over the heapq-based implementation.
+JIT_MIN_TASKS = 10_000
+
+def moore_hodgson(durations: np.ndarray, deadlines: np.ndarray) -> np.ndarray:
+    """
+    Selects the largest set of tasks that can be completed on time (Moore-Hodgson algorithm).
+
+    Uses a Numba-compiled kernel for at least `JIT_MIN_TASKS` tasks with integer data if Numba
+    is installed, and a `heapq`-based implementation otherwise.
+
+    Parameters
+    ----------
+    durations : np.ndarray
+        Durations of the tasks sorted by deadline.
+    deadlines : np.ndarray
+        Deadlines of the tasks in ascending order.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the tasks that are completed on time.
+    """
+    durations = np.asarray(durations)
+    deadlines = np.asarray(deadlines)
+    integral = np.issubdtype(durations.dtype, np.integer) and np.issubdtype(deadlines.dtype, np.integer)
+    kernel = _load_jit() if integral and len(durations) >= JIT_MIN_TASKS else None
+    if kernel is None:
+        return _moore_hodgson_heapq(durations, deadlines)
+
+    accepted = np.ones(len(durations), dtype=np.bool_)
+    kernel(np.ascontiguousarray(durations, dtype=np.int64),
+           np.ascontiguousarray(deadlines, dtype=np.int64), accepted)
+    return accepted
+
+def _moore_hodgson_heapq(durations: np.ndarray, deadlines: np.ndarray) -> np.ndarray:
+    """
+    Pure Python implementation of `moore_hodgson`.
+    """
+    accepted = np.ones(len(durations), dtype=bool)
+    heap = [] # Max-heap of accepted tasks by duration (durations are negated)
+    time = 0
+
+    for k, (duration, deadline) in enumerate(zip(durations.tolist(), deadlines.tolist())):
+        heapq.heappush(heap, (-duration, k))
+        time += duration
+        if time > deadline:
+            # Drop the longest accepted task to bring completion time back under the deadline
+            longest, index = heapq.heappop(heap)
+            time += longest
+            accepted[index] = False
+
+    return accepted
+
+def _moore_hodgson_kernel(durations: np.ndarray, deadlines: np.ndarray, accepted: np.ndarray) -> None:
+    """
+    Array-backed implementation of `moore_hodgson` for compilation with Numba.
+
+    Clears `accepted` for the dropped tasks. Ties between equally long tasks are broken
+    in favour of the earlier task, as in `_moore_hodgson_heapq`.
+    """
+    heap = np.empty(len(durations), dtype=np.int64) # Binary max-heap of accepted task indices
+    size = 0
+    time = 0
+
+    for k in range(len(durations)):
+        # Sift the new task up
+        i = size
+        size += 1
+        while i > 0:
+            parent = (i - 1) // 2
+            index = heap[parent]
+            if durations[index] >= durations[k]:
+                break
+            heap[i] = index
+            i = parent
+        heap[i] = k
+
+        time += durations[k]
+        if time > deadlines[k]:
+            # Drop the longest accepted task to bring completion time back under the deadline
+            longest = heap[0]
+            time -= durations[longest]
+            accepted[longest] = False
+
+            # Move the last task to the root and sift it down
+            size -= 1
+            last = heap[size]
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= size:
+                    break
+                right = child + 1
+                if right < size and (durations[heap[right]] > durations[heap[child]] or
+                                     (durations[heap[right]] == durations[heap[child]] and heap[right] < heap[child])):
+                    child = right
+                index = heap[child]
+                if durations[last] > durations[index] or (durations[last] == durations[index] and last < index):
+                    break
+                heap[i] = index
+                i = child
+            heap[i] = last
+
+@functools.lru_cache(maxsize=None)
+def _load_jit():
+    """
+    Compiles `_moore_hodgson_kernel` with Numba on first use.
+
+    Numba is imported here rather than at module level, since importing it is slow.
+    Returns None if Numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError: # Numba is optional, pure Python implementation is used without it
+        return None
+    return njit(cache=True)(_moore_hodgson_kernel)
@@ -1,19 +1,76 @@
+import functools
+import gc
 import cvxpy as cp
-from typing import List
-from scheduler.classes import Task, ScheduleItem, Schedule
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Union
+from scheduler.classes import Task, Tasks, ScheduleItem, Schedule
+from scheduler.greedy import moore_hodgson
 
-def create_optimal_schedule(tasks: List[Task], max_time=None, verbose: bool=False) -> Schedule:
+try:
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import diags, hstack
+except ImportError: # SciPy < 1.9 has no MILP interface, CVXPY is used instead
+    milp = None
+
+# Mapping of scipy.optimize.milp (HiGHS) status codes to CVXPY status strings
+HIGHS_STATUS_MAP = {
+    0: "optimal",
+    1: "user_limit",
+    2: "infeasible",
+    3: "unbounded",
+    4: "solver_error",
+}
+
+# Largest number of (task, completion time) states for which the schedule is computed
+# by dynamic programming instead of a MILP solver
+DP_MAX_STATES = 10_000_000
+
+def _sort_by_deadline(tasks: Tasks) -> Tuple[Tasks, np.ndarray]:
+    """
+    Orders tasks by deadline (EDF), keeping tasks with equal deadlines in their original order.
+    Any set of tasks that can be completed on time can also be completed on time when
+    executed in this order.
+
+    Returns
+    -------
+    Tuple[Tasks, np.ndarray]
+        Sorted tasks and the permutation mapping positions in deadline order to original task indices.
+    """
+    order = np.argsort(tasks.deadline, kind="stable")
+    sorted_tasks = Tasks(deadline=np.asarray(tasks.deadline)[order], duration=np.asarray(tasks.duration)[order],
+                         reward=np.asarray(tasks.reward)[order])
+    return sorted_tasks, order
+
+def _build_schedule(sequence: np.ndarray, durations: np.ndarray, deadlines: np.ndarray,
+                    rewards: np.ndarray, status: str) -> Schedule:
+    """
+    Builds a schedule executing tasks sequentially in the given order.
+    """
+    sequence_durations = durations[sequence]
+    start_times = np.cumsum(sequence_durations) - sequence_durations
+    on_time = start_times + sequence_durations <= deadlines[sequence]
+    total_reward = rewards[sequence][on_time].sum().item()
+
+    schedule_items = [
+        ScheduleItem(task_index=task_index, start_time=start_time, is_on_time=is_on_time)
+        for task_index, start_time, is_on_time in zip(sequence.tolist(), start_times.tolist(), on_time.tolist())
+    ]
+
+    return Schedule(items=schedule_items, total_reward=total_reward, status=status)
+
+def create_optimal_schedule(tasks: Union[Tasks, List[Task]], max_time=None, verbose: bool=False) -> Schedule:
     """
     Computes an optimal schedule that maximizes the total reward.
 
     This function describes the scheduling problem as a MILP (mixed integer linear programming)
-    problem and solves it using the CVXPY library. The objective is to maximize the total reward
+    problem and solves it using HiGHS through SciPy. The objective is to maximize the total reward
     while ensuring that all tasks are executed sequentially.
 
     Parameters
     ----------
-    tasks : List[Task]
-        A list of Task objects representing the tasks to be scheduled.
+    tasks : Union[Tasks, List[Task]]
+        The tasks to be scheduled, either as Tasks or as a list of Task objects.
     max_time : int, optional
         Maximum time allowed for a solver to spend on task (default is None)
     debug : bool, optional
@@ -28,93 +85,315 @@ def create_optimal_schedule(tasks: List[Task], max_time=None, verbose: bool=Fals
 
     Notes
     -----
-    - The optimization problem is solved using the SCIP solver.
-    - The Big-M method is used to define deadline constraints.
-    - The MILP constraints ensure that:
-        - Each task is assigned exactly once.
-        - Each task executes sequentially.
-        - Tasks completed on time contribute to the total reward.
+    - The optimization problem is solved using the HiGHS solver (`scipy.optimize.milp`).
+      If the installed SciPy has no MILP interface, CVXPY with the SCIP solver is used.
+    - Tasks are ordered by deadline (EDF) and only a boolean acceptance variable is
+      introduced per task (the classical 1||sum w_j U_j formulation).
+    - The MILP constraints track the completion time of accepted tasks executed sequentially
+      in deadline order with a recurrence (one row per task) and ensure that every accepted
+      task completes before its deadline. Deadlines that hold even when all tasks are
+      accepted are not imposed in the HiGHS model.
+    - The CVXPY model is parametrized and cached per (padded) problem size, so repeated
+      calls skip canonicalization. CVXPY does not reliably free memory held by problems,
+      so long-running processes should call `release_solver_cache` once they are done
+      with scheduling.
+    - Accepted tasks are placed first in deadline order, rejected tasks follow them.
+    - Tasks that cannot be completed on time even if executed first are rejected before
+      any other stage and placed at the end of the schedule.
+    - Trivial instances, where every remaining task or no task can be completed on time,
+      are solved without invoking the solver.
+    - If all tasks have the same reward, the problem is solved exactly by the Moore-Hodgson
+      algorithm in O(N log N) without invoking the solver. Otherwise the Moore-Hodgson
+      solution, once checked to be feasible, is passed to the solver as the initial
+      incumbent: its reward bounds the objective from below, and it is returned if the
+      solver hits the time limit first.
+    - Instances with integer data where the number of tasks times the scheduling horizon
+      does not exceed `DP_MAX_STATES` are solved exactly by dynamic programming in
+      O(N * horizon) without invoking the solver.
     """
 
     if not tasks:
         return Schedule(items=[], total_reward=0, status=None)
 
-    N = len(tasks) # Number of tasks
-    deadlines = [task.deadline for task in tasks]
-    durations = [task.duration for task in tasks]
-    rewards = [task.reward for task in tasks]
+    if not isinstance(tasks, Tasks):
+        tasks = Tasks.from_list(tasks)
+    deadlines = np.asarray(tasks.deadline)
+    durations = np.asarray(tasks.duration)
+    rewards = np.asarray(tasks.reward)
 
-    # x[i, j] = 1 if task i is assigned to position j
-    x = cp.Variable((N, N), boolean=True)
+    sorted_tasks, order = _sort_by_deadline(tasks)
 
-    # Start times of tasks in ascending order
-    s = cp.Variable(N)
+    # Tasks that cannot be completed on time even if executed first are rejected upfront,
+    # the schedule is selected from the remaining candidates
+    candidates = sorted_tasks.duration <= sorted_tasks.deadline
+    hopeless = order[~candidates]
+    order = order[candidates]
+    deadlines_sorted = sorted_tasks.deadline[candidates]
+    durations_sorted = sorted_tasks.duration[candidates]
+    rewards_sorted = sorted_tasks.reward[candidates]
 
-    # z[i] = 1 if task i finishes on time
-    z = cp.Variable(N, boolean=True)
+    def schedule(accepted: np.ndarray, status: str) -> Schedule:
+        # Accepted tasks first, rejected candidates after them, hopeless tasks last
+        sequence = np.concatenate((order[accepted], order[~accepted], hopeless))
+        return _build_schedule(sequence, durations, deadlines, rewards, status=status)
+
+    # No task can be completed on time even if executed first
+    if not candidates.any():
+        return schedule(np.zeros(0, dtype=bool), status="optimal")
+
+    # All candidates are completed on time when executed in deadline order
+    if np.all(rewards_sorted >= 0) and np.all(np.cumsum(durations_sorted) <= deadlines_sorted):
+        return schedule(np.ones(len(order), dtype=bool), status="optimal")
+
+    # With equal rewards maximizing the reward is maximizing the number of on-time tasks
+    if np.all(rewards_sorted == rewards_sorted[0]) and rewards_sorted[0] >= 0:
+        return schedule(moore_hodgson(durations_sorted, deadlines_sorted), status="optimal")
+
+    # With integer data and a short horizon the problem is solved exactly by dynamic programming
+    horizon = min(int(durations_sorted.sum()), int(deadlines_sorted[-1]))
+    integral = all(np.issubdtype(values.dtype, np.integer) for values in (durations, deadlines, rewards))
+    if integral and durations_sorted.min() >= 0 and len(durations_sorted) * (horizon + 1) <= DP_MAX_STATES:
+        return schedule(_solve_dp(durations_sorted, deadlines_sorted, rewards_sorted, horizon), status="optimal")
+
+    # Moore-Hodgson selection serves as the initial incumbent, provided it is feasible
+    incumbent = moore_hodgson(durations_sorted, deadlines_sorted)
+    completion_times = np.cumsum(durations_sorted * incumbent)
+    if not np.all(completion_times[incumbent] <= deadlines_sorted[incumbent]):
+        incumbent = None
+
+    solve = _solve_highs if milp is not None else _solve_cvxpy
+    accepted, status = solve(durations_sorted, deadlines_sorted, rewards_sorted, incumbent,
+                             max_time=max_time, verbose=verbose)
+    if accepted is None and status == "user_limit" and incumbent is not None:
+        # Solver ran out of time before finding a solution at least as good as the incumbent
+        accepted, status = incumbent, "optimal_inaccurate"
+    if accepted is None:
+        return Schedule(items=[], total_reward=None, status=status)
+
+    return schedule(accepted, status=status)
 
-    constraints = [] # Constraints
+def create_optimal_schedules(task_sets: Iterable[Union[Tasks, List[Task]]], max_time=None,
+                             max_workers: Optional[int]=None) -> List[Schedule]:
+    """
+    Computes optimal schedules for several independent sets of tasks in parallel.
 
-    # Each task must be assigned exactly once
-    for i in range(N):
-        constraints.append(cp.sum(x[i, :]) == 1)
+    Each set of tasks is scheduled by `create_optimal_schedule` in a pool of worker processes.
+    Solver state (including cached CVXPY problems) is local to a process, so workers share nothing.
 
-    # Each position must be occupied by exactly one task
-    for j in range(N):
-        constraints.append(cp.sum(x[:, j]) == 1)
+    Parameters
+    ----------
+    task_sets : Iterable[Union[Tasks, List[Task]]]
+        Sets of tasks to be scheduled.
+    max_time : int, optional
+        Maximum time allowed for a solver to spend on each set of tasks (default is None)
+    max_workers : int, optional
+        Maximum number of worker processes (default is None, the number of processors).
 
-    constraints.append(s[0] == 0)
+    Returns
+    -------
+    List[Schedule]
+        Schedules in the order of the sets of tasks.
+    """
+    schedule = functools.partial(create_optimal_schedule, max_time=max_time)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(schedule, task_sets))
+
+def release_solver_cache() -> None:
+    """
+    Releases the cached CVXPY problems together with their canonicalized data.
 
-    # Tasks must be executed sequentially
-    for j in range(N - 1):
-        constraints.append(s[j + 1] == s[j] + cp.sum(cp.multiply(durations, x[:, j])))
+    Works around CVXPY retaining memory of solved problems until the upstream leak is resolved.
+    """
+    _build_problem.cache_clear()
+    gc.collect()
+
+def _solve_dp(durations: np.ndarray, deadlines: np.ndarray, rewards: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Solves the EDF acceptance problem exactly by dynamic programming over completion times.
+
+    Parameters
+    ----------
+    durations, deadlines, rewards : np.ndarray
+        Non-negative integer durations, integer deadlines and rewards of the tasks sorted by deadline.
+    horizon : int
+        Latest completion time of the accepted tasks to consider.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the accepted tasks.
+    """
+    N = len(durations)
 
-    # Constant for Big-M method
-    M = 10000
+    # reward[t] is the best reward of accepted tasks completing exactly at time t
+    reward = np.full(horizon + 1, -np.inf)
+    reward[0] = 0
 
-    for i in range(N):
-        # If task is scheduled, z can be 1
-        constraints.append(z[i] <= cp.sum(x[i, :]))
-        
-        for j in range(N):
-            # Ensure deadline is met
-            constraints.append(s[j] + durations[i] <= deadlines[i] + M * (1 - x[i, j]) + M * (1 - z[i]))
+    # taken[k, t] is True if k-th task is the last accepted one in the best selection completing at t
+    taken = np.zeros((N, horizon + 1), dtype=bool)
+
+    for k in range(N):
+        duration, deadline = int(durations[k]), min(int(deadlines[k]), horizon)
+        if duration > deadline or rewards[k] <= 0:
+            continue
+        candidate = reward[:deadline + 1 - duration] + rewards[k]
+        better = candidate > reward[duration:deadline + 1]
+        reward[duration:deadline + 1][better] = candidate[better]
+        taken[k, duration:deadline + 1] = better
+
+    # Walk back from the best completion time
+    accepted = np.zeros(N, dtype=bool)
+    time = int(np.argmax(reward))
+    for k in range(N - 1, -1, -1):
+        if taken[k, time]:
+            accepted[k] = True
+            time -= int(durations[k])
+
+    return accepted
+
+def _solve_highs(durations: np.ndarray, deadlines: np.ndarray, rewards: np.ndarray, incumbent: Optional[np.ndarray],
+                 max_time=None, verbose: bool=False) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Solves the EDF acceptance problem with HiGHS through scipy.optimize.milp.
+
+    Parameters
+    ----------
+    durations, deadlines, rewards : np.ndarray
+        Task data sorted by deadline.
+    incumbent : np.ndarray, optional
+        Boolean mask of a feasible selection of tasks; optimal solution is at least as good.
+        If None, the reward is not bounded from below.
+    max_time : int, optional
+        Maximum time allowed for a solver to spend on task (default is None)
+    verbose : bool, optional
+        If True, prints solver output (default is False).
+
+    Returns
+    -------
+    Tuple[Optional[np.ndarray], str]
+        Boolean mask of the accepted tasks (None if no solution was found) and solver status.
+    """
+    N = len(durations)
+
+    # Variables are z[k] = 1 if k-th task in deadline order is accepted (finishes on time)
+    # followed by c[k], the completion time of the accepted tasks up to k-th.
+    # Accepted tasks are executed first in deadline order, so c[k] = c[k-1] + durations[k] * z[k].
+    recurrence = hstack([
+        -diags(durations.astype(float)),
+        diags([np.ones(N), -np.ones(N - 1)], offsets=[0, -1]),
+    ])
+    constraints = [LinearConstraint(recurrence, 0, 0)]
+
+    # Optimal reward is not less than the reward of the incumbent
+    objective = np.concatenate((rewards, np.zeros(N)))
+    if incumbent is not None:
+        constraints.append(LinearConstraint(objective[None, :], rewards @ incumbent, np.inf))
+
+    # Completion time must not exceed the deadline. Deadlines met even if every preceding
+    # task is accepted can never be violated and are left unbounded. Tasks that miss the
+    # deadline even if executed first are rejected, their completion time is unbounded too.
+    hopeless = durations > deadlines
+    binding = (np.cumsum(durations) > deadlines) & ~hopeless
+    completion_bounds = np.where(binding, deadlines, np.inf)
+
+    # HiGHS stops at a relative gap of 1e-4 by default, require a proven optimum instead
+    options = {"disp": verbose, "mip_rel_gap": 0}
+    if max_time is not None:
+        options["time_limit"] = max_time
+
+    result = milp(-objective, constraints=constraints,
+                  integrality=np.concatenate((np.ones(N), np.zeros(N))),
+                  bounds=Bounds(np.zeros(2 * N), np.concatenate((~hopeless, completion_bounds))),
+                  options=options)
+
+    status = HIGHS_STATUS_MAP.get(result.status, "solver_error")
+    if result.x is None:
+        return None, status
+    if status == "user_limit":
+        status = "optimal_inaccurate" # Time limit reached with a feasible solution
+
+    return result.x[:N] > 0.5, status
+
+@functools.lru_cache(maxsize=32)
+def _build_problem(N: int) -> Tuple[cp.Problem, cp.Parameter, cp.Parameter, cp.Parameter, cp.Parameter, cp.Variable]:
+    """
+    Builds the EDF acceptance problem for N tasks with task data given as parameters.
+
+    The problem is cached, so CVXPY canonicalizes it only once per problem size.
+    """
+    durations = cp.Parameter(N)
+    deadlines = cp.Parameter(N)
+    rewards = cp.Parameter(N)
+    min_reward = cp.Parameter()
+
+    # z[k] = 1 if k-th task in deadline order is accepted (finishes on time)
+    z = cp.Variable(N, boolean=True)
+
+    # c[k] is the completion time of the accepted tasks up to k-th in deadline order
+    c = cp.Variable(N)
+
+    # Accepted tasks are executed first in deadline order, so k-th accepted task
+    # completes after the total duration of all accepted tasks preceding it
+    constraints = [
+        c[0] == durations[0] * z[0],
+        c[1:] == c[:-1] + cp.multiply(durations[1:], z[1:]),
+        c <= deadlines,
+    ]
+
+    # Optimal reward is not less than the reward of the incumbent
+    constraints.append(rewards @ z >= min_reward)
 
     # Objective function: Maximize total reward
-    reward = cp.sum(cp.multiply(rewards, z))
-    objective = cp.Maximize(reward)
+    objective = cp.Maximize(rewards @ z)
 
-    # Solve the problem
-    prob = cp.Problem(objective, constraints)
+    return cp.Problem(objective, constraints), durations, deadlines, rewards, min_reward, z
+
+def _solve_cvxpy(durations: np.ndarray, deadlines: np.ndarray, rewards: np.ndarray, incumbent: Optional[np.ndarray],
+                 max_time=None, verbose: bool=False) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Solves the EDF acceptance problem with CVXPY and the SCIP solver.
+
+    Takes the same parameters and returns the same values as `_solve_highs`.
+    Problems are padded to the next power of two with zero-duration, zero-reward tasks
+    due at the latest deadline, so that a few cached problems serve all sizes.
+    The incumbent, if given, is also passed as a warm start for solver interfaces that accept one.
+    """
+    N = len(durations)
+    size = 1 << (N - 1).bit_length()
+    padding = size - N
+
+    prob, durations_param, deadlines_param, rewards_param, min_reward_param, z = _build_problem(size)
+    durations_param.value = np.pad(durations, (0, padding))
+    deadlines_param.value = np.pad(deadlines, (0, padding), mode="edge")
+    rewards_param.value = np.pad(rewards, (0, padding))
+    if incumbent is not None:
+        min_reward_param.value = rewards @ incumbent
+        z.value = np.pad(incumbent, (0, padding)).astype(float)
+    else:
+        # Reward of any selection is at least the sum of negative rewards
+        min_reward_param.value = np.minimum(rewards, 0).sum()
+        z.value = None
 
     scip_params = dict()
     if max_time is not None:
         scip_params["limits/time"] = max_time
 
     try:
-        prob.solve(solver=cp.SCIP, verbose=verbose, scip_params=scip_params)
+        prob.solve(solver=cp.SCIP, verbose=verbose, warm_start=True, scip_params=scip_params)
     except cp.error.SolverError as e:
         print(f"Failed to solve the MILP problem: {e}")
         status = prob.status if prob.status is not None else "undefined"
-        return Schedule(items=[], total_reward=None, status=status)
+        return None, status
+
+    if z.value is None:
+        return None, prob.status
 
     if verbose:
-        print(x.value)
-        print(s)
-        print(z)
-
-    # Extract results
-    schedule_items = []
-    start_time = 0
-    total_reward = 0
-
-    for position in range(N):
-        for task_index in range(N):
-            if x[task_index, position].value > 0.5:  # Task is assigned to position
-                on_time = (start_time + durations[task_index] <= deadlines[task_index])
-                if on_time:
-                    total_reward += rewards[task_index]
-                schedule_items.append(ScheduleItem(task_index=task_index, start_time=start_time, is_on_time=on_time))
-                start_time += durations[task_index]
-
-    return Schedule(items=schedule_items, total_reward=total_reward, status=prob.status)
\ No newline at end of file
+        print(z.value)
+
+    accepted = z.value[:N] > 0.5
+
+    # Drop the solution from the cached problem so it does not outlive the call
+    z.value = None
+
+    return accepted, prob.status
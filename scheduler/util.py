@@ -1,12 +1,12 @@
 import csv
-import random
-from typing import List
-from scheduler.classes import Task, Schedule
+import numpy as np
+from scheduler.classes import Tasks, Schedule
 
-def read_tasks_from_csv(filename: str) -> List[Task]:
+def read_tasks_from_csv(filename: str) -> Tasks:
     """
-    Reads tasks from a CSV file and returns them as a list.
+    Reads tasks from a CSV file.
     The CSV file must contain three columns: `deadline`, `duration`, and `reward`.
+    Rows with fewer than three columns are skipped.
 
     Parameters
     ----------
@@ -15,8 +15,8 @@ def read_tasks_from_csv(filename: str) -> List[Task]:
 
     Returns
     -------
-    List[Task]
-        A list of Task objects.
+    Tasks
+        Tasks read from the file.
 
     Raises
     ------
@@ -25,16 +25,18 @@ def read_tasks_from_csv(filename: str) -> List[Task]:
     ValueError
         If the CSV file is missing required columns or contains invalid data.
     """
-    tasks = []
-    with open(filename, mode='r', newline='') as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip header row if present
-        for row in reader:
-            if len(row) < 3:
-                continue  # Skip invalid rows
-            deadline, duration, reward = map(int, row[:3])
-            tasks.append(Task(deadline=deadline, duration=duration, reward=reward))
-    return tasks
+    try:
+        data = np.loadtxt(filename, delimiter=',', skiprows=1, usecols=(0, 1, 2), dtype=np.int64, ndmin=2)
+    except ValueError:
+        # Skip invalid rows with fewer than three columns and parse the remaining ones
+        with open(filename, mode='r', newline='') as file:
+            reader = csv.reader(file)
+            next(reader)  # Skip header row if present
+            rows = [",".join(row[:3]) for row in reader if len(row) >= 3]
+        data = np.loadtxt(rows, delimiter=',', dtype=np.int64, ndmin=2)
+    # Transpose into a single buffer so that every column is contiguous
+    deadline, duration, reward = np.ascontiguousarray(data.reshape(-1, 3).T)
+    return Tasks(deadline=deadline, duration=duration, reward=reward)
 
 def save_schedule_to_csv(schedule: Schedule, file_path: str) -> None:
     """
@@ -50,15 +52,13 @@ def save_schedule_to_csv(schedule: Schedule, file_path: str) -> None:
     with open(file_path, mode="w", newline="") as file:
         writer = csv.writer(file)
         writer.writerow(["Task Index", "Start Time", "On Time"])
-        for item in schedule.items:
-            writer.writerow([item.task_index, item.start_time, item.is_on_time])
-        writer.writerow([])
-        writer.writerow(["Total Reward", schedule.total_reward])
+        writer.writerows((item.task_index, item.start_time, item.is_on_time) for item in schedule.items)
+        writer.writerows([[], ["Total Reward", schedule.total_reward]])
 
 def generate_tasks(num_tasks: int, min_duration: int, max_duration: int,
-                   min_deadline: int, max_deadline: int, min_reward: int, max_reward: int) -> List[Task]:
+                   min_deadline: int, max_deadline: int, min_reward: int, max_reward: int) -> Tasks:
     """
-    Generates a list of random tasks.
+    Generates random tasks.
 
     Parameters
     ----------
@@ -79,34 +79,28 @@ def generate_tasks(num_tasks: int, min_duration: int, max_duration: int,
 
     Returns
     -------
-    List[Task]
-        A list of generated Task objects.
+    Tasks
+        Generated tasks.
     """
-    tasks = [
-        Task(
-            deadline=random.randint(min_deadline, max_deadline),
-            duration=random.randint(min_duration, max_duration),
-            reward=random.randint(min_reward, max_reward),
-        )
-        for _ in range(num_tasks)
-    ]
-    return tasks
+    rng = np.random.default_rng()
+    return Tasks(
+        deadline=rng.integers(min_deadline, max_deadline, size=num_tasks, endpoint=True),
+        duration=rng.integers(min_duration, max_duration, size=num_tasks, endpoint=True),
+        reward=rng.integers(min_reward, max_reward, size=num_tasks, endpoint=True),
+    )
 
-def save_tasks_to_csv(tasks: List[Task], output_file: str):
+def save_tasks_to_csv(tasks: Tasks, output_file: str):
     """
-    Saves a list of tasks to a CSV file.
+    Saves tasks to a CSV file.
 
     Parameters
     ----------
-    tasks : List[Task]
-        List of Task objects to be saved.
+    tasks : Tasks
+        Tasks to be saved.
     output_file : str
         Path to the output CSV file.
     """
-    with open(output_file, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(["deadline", "duration", "reward"])  # Write header
-        for task in tasks:
-            writer.writerow([task.deadline, task.duration, task.reward])
+    data = np.column_stack([tasks.deadline, tasks.duration, tasks.reward])
+    np.savetxt(output_file, data, fmt='%d', delimiter=',', header='deadline,duration,reward', comments='')
 
     print(f"Saved {len(tasks)} tasks to {output_file}")
\ No newline at end of file
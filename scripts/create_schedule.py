@@ -1,13 +1,13 @@
 import argparse
-from typing import List
-from scheduler.classes import Task, Schedule
+import sys
+from scheduler.classes import Tasks, Schedule
 from scheduler.optimizer import create_optimal_schedule
 from scheduler.util import (
     read_tasks_from_csv,
     save_schedule_to_csv,
 )
 
-def print_schedule(tasks: List[Task], schedule: Schedule):
+def print_schedule(tasks: Tasks, schedule: Schedule):
     """
     Prints schedule.
     """
@@ -15,10 +15,12 @@ def print_schedule(tasks: List[Task], schedule: Schedule):
     print(f"{'Slot':<6} {'Task':<6} {'Start Time (s)':<15} {'On Time':<10} {'Reward':<8}")
     print("-" * 50)
 
+    lines = []
     for slot_index, item in enumerate(schedule.items):
-        task = tasks[item.task_index]
-        reward = task.reward if item.is_on_time else "—"  # Show reward only if on time
-        print(f"{slot_index:<6} {item.task_index:<6} {item.start_time:<15} {str(item.is_on_time):<10} {reward:<8}")
+        reward = tasks.reward[item.task_index] if item.is_on_time else "—"  # Show reward only if on time
+        lines.append(f"{slot_index:<6} {item.task_index:<6} {item.start_time:<15} {str(item.is_on_time):<10} {reward:<8}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("-" * 50)
 
@@ -1,7 +1,14 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 import numpy as np
-from scheduler.optimizer import create_optimal_schedule
-from scheduler.classes import Task, Schedule
+from scheduler import optimizer
+from scheduler.optimizer import create_optimal_schedule, create_optimal_schedules
+from scheduler.classes import Task, Tasks, Schedule
+from scheduler import greedy
+from scheduler.greedy import moore_hodgson, _moore_hodgson_heapq
+from scheduler.util import read_tasks_from_csv
 
 class TestScheduler(unittest.TestCase):
     """
@@ -28,7 +35,7 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(schedule.status, "optimal")
         self.assertEqual(schedule.total_reward, 90)
         self.assertEqual(len(schedule.items), len(tasks))
-        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [0,2,1])
+        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [2,0,1])
 
     def test_schedule_2(self):
         """
@@ -48,6 +55,143 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(schedule.total_reward, 350)
         self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [2,1,0])
 
+    def test_tasks_as_arrays(self):
+        """
+        Scenario:
+          - Same tasks as in 'test_schedule_2' passed as a Tasks structure of arrays.
+          - Checks that the schedule is identical to the one built from a list of Task objects.
+        """
+        tasks = Tasks(
+            deadline=np.array([5, 6, 4]),
+            duration=np.array([3, 3, 2]),
+            reward=np.array([100, 200, 150])
+        )
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 350)
+        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [2,1,0])
+
+    def test_large_horizon(self):
+        """
+        Scenario:
+          - Same tasks as in 'test_schedule_2' with times scaled by 10^6.
+          - The horizon is too long for dynamic programming, so the schedule is found by the MILP solver.
+        """
+        tasks = [
+            Task(deadline=5_000_000, duration=3_000_000, reward=100),
+            Task(deadline=6_000_000, duration=3_000_000, reward=200),
+            Task(deadline=4_000_000, duration=2_000_000, reward=150)
+        ]
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 350)
+        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [2,1,0])
+
+    def test_infeasible_incumbent(self):
+        """
+        Scenario:
+          - Same tasks as in 'test_large_horizon' with a greedy selection that accepts every task,
+            which misses deadlines.
+          - Checks that the infeasible incumbent is discarded instead of making the MILP infeasible.
+        """
+        tasks = [
+            Task(deadline=5_000_000, duration=3_000_000, reward=100),
+            Task(deadline=6_000_000, duration=3_000_000, reward=200),
+            Task(deadline=4_000_000, duration=2_000_000, reward=150)
+        ]
+        with mock.patch.object(optimizer, "moore_hodgson", lambda durations, deadlines: np.ones(len(durations), dtype=bool)):
+            schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 350)
+
+    def test_hopeless_task(self):
+        """
+        Scenario:
+          - A task with a negative deadline mixed into an instance solved by the MILP.
+          - Checks that the hopeless task is rejected instead of making the MILP infeasible.
+        """
+        tasks = [
+            Task(deadline=-1.0, duration=1.0, reward=1.0),
+            Task(deadline=5.0, duration=2.5, reward=2.0),
+            Task(deadline=5.0, duration=3.0, reward=3.0)
+        ]
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertAlmostEqual(schedule.total_reward, 3.0)
+        self.assertEqual(schedule.items[-1].task_index, 0)
+        self.assertFalse(schedule.items[-1].is_on_time)
+
+        with mock.patch.object(optimizer, "milp", None):
+            schedule = create_optimal_schedule(tasks)
+
+        self.assertIn(schedule.status, ["optimal", "optimal_inaccurate"])
+        self.assertAlmostEqual(schedule.total_reward, 3.0)
+
+    def test_non_integer_task_list(self):
+        """
+        Scenario:
+          - List of Task objects with non-integer deadlines, durations and rewards.
+          - Checks that the values are not truncated when converted to arrays.
+        """
+        tasks = [
+            Task(deadline=5.0, duration=2.6, reward=1.5),
+            Task(deadline=5.0, duration=2.6, reward=2.5),
+            Task(deadline=9.0, duration=1.0, reward=3.0)
+        ]
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 5.5)
+        self.assertEqual(list(map(lambda p: p.start_time, schedule.items)), [0.0, 2.6, 3.6])
+
+    def test_read_tasks_skips_invalid_rows(self):
+        """
+        Scenario:
+          - CSV file with a row that has fewer than three columns and an empty row.
+          - Checks that such rows are skipped and the remaining tasks are read.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tasks.csv")
+            with open(path, "w") as file:
+                file.write("deadline,duration,reward\n5,3,100\n6,3\n\n4,2,150\n")
+            tasks = read_tasks_from_csv(path)
+
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(tasks[1], Task(deadline=4, duration=2, reward=150))
+
+    def test_cvxpy_fallback(self):
+        """
+        Scenario:
+          - Three tasks sorted by deadline solved twice by the CVXPY fallback, padded to four tasks.
+          - Checks that the second solve reuses the cached problem, that the accepted tasks are correct,
+            that the solution is not kept in the cached problem and that the cache can be released.
+        """
+        durations = np.array([2, 3, 3])
+        deadlines = np.array([4, 5, 6])
+        rewards = np.array([150, 100, 200])
+        incumbent = np.array([True, False, False])
+
+        optimizer._build_problem.cache_clear()
+        for _ in range(2):
+            accepted, status = optimizer._solve_cvxpy(durations, deadlines, rewards, incumbent)
+
+            self.assertEqual(status, "optimal")
+            np.testing.assert_array_equal(accepted, [True, False, True])
+
+        cache_info = optimizer._build_problem.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+        z = optimizer._build_problem(4)[-1]
+        self.assertIsNone(z.value)
+
+        optimizer.release_solver_cache()
+        self.assertEqual(optimizer._build_problem.cache_info().currsize, 0)
+
     def test_no_tasks(self):
         """
         Scenario:
@@ -94,17 +238,147 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(schedule.total_reward, 0)
         self.assertEqual(len(schedule.items), 3)
     
+    def test_tasks_with_equal_rewards(self):
+        """
+        Scenario:
+          - All tasks have the same reward, so the schedule maximizes the number of on-time tasks.
+          - No three tasks fit before the latest deadline, the longest task with the earliest
+            deadline is dropped in favour of two shorter ones.
+        """
+        tasks = [
+            Task(deadline=4, duration=3, reward=10),
+            Task(deadline=5, duration=2, reward=10),
+            Task(deadline=6, duration=2, reward=10),
+            Task(deadline=6, duration=4, reward=10)
+        ]
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 20)
+        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [1,2,0,3])
+
+    def test_moore_hodgson_implementations(self):
+        """
+        Scenario:
+          - Random integer and non-integer tasks with many ties in durations and deadlines.
+          - Checks that the array-backed kernel (and its compiled version if Numba is installed)
+            and the dispatching 'moore_hodgson' select the same tasks as the heapq-based implementation.
+        """
+        kernels = [greedy._moore_hodgson_kernel]
+        jit = greedy._load_jit()
+        if jit is not None:
+            kernels.append(jit)
+
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            for durations, deadlines in [
+                (rng.integers(0, 5, size=30), np.sort(rng.integers(0, 40, size=30))),
+                (rng.integers(0, 10, size=30) / 2, np.sort(rng.integers(0, 40, size=30)) / 2),
+            ]:
+                expected = _moore_hodgson_heapq(durations, deadlines)
+                np.testing.assert_array_equal(moore_hodgson(durations, deadlines), expected)
+                for kernel in kernels:
+                    accepted = np.ones(len(durations), dtype=bool)
+                    kernel(durations, deadlines, accepted)
+                    np.testing.assert_array_equal(accepted, expected)
+
+        # Non-integer durations must not be truncated: only one of two tasks fits
+        self.assertEqual(moore_hodgson(np.array([2.6, 2.6]), np.array([5.0, 5.0])).sum(), 1)
+
+    def test_non_integer_tasks(self):
+        """
+        Scenario:
+          - Tasks with non-integer deadlines and durations, so dynamic programming does not apply.
+          - Only one of the two tasks due at 5.0 fits, the best schedule takes the more rewarding one.
+        """
+        tasks = Tasks(
+            deadline=np.array([5.0, 5.0, 9.0]),
+            duration=np.array([2.6, 2.6, 1.0]),
+            reward=np.array([1, 2, 3])
+        )
+        schedule = create_optimal_schedule(tasks)
+
+        self.assertEqual(schedule.status, "optimal")
+        self.assertEqual(schedule.total_reward, 5)
+        self.assertEqual(list(map(lambda p: p.task_index, schedule.items)), [1,2,0])
+
     def test_large_number_of_tasks(self):
         """
         Scenario:
-          - 20 tasks randomly generated with durations in [1,4] and rewards in [10,99].
+          - 4 sets of 20 tasks randomly generated with durations in [1,4] * 10^6 and rewards in [10,99],
+            due at 4 * 10^7 and scheduled in parallel.
+          - The horizon is too long for dynamic programming, so every set is solved by the MILP solver.
           - A short max_time=10 sec is set, so the solver might produce an optimal_inaccurate result if it can't guarantee full optimality in that time.
         """
-        tasks = [Task(deadline=50, duration=np.random.randint(1, 5), reward=np.random.randint(10, 100)) for _ in range(20)]
-        schedule = create_optimal_schedule(tasks, max_time=10)
-        
-        self.assertIn(schedule.status, ["optimal", "optimal_inaccurate"])
-        self.assertEqual(len(schedule.items), len(tasks))
+        rng = np.random.default_rng(0)
+        task_sets = [
+            Tasks(
+                deadline=np.full(20, 40_000_000),
+                duration=rng.integers(1, 5, size=20) * 1_000_000,
+                reward=rng.integers(10, 100, size=20)
+            )
+            for _ in range(4)
+        ]
+        schedules = create_optimal_schedules(task_sets, max_time=10)
+
+        self.assertEqual(len(schedules), len(task_sets))
+        for tasks, schedule in zip(task_sets, schedules):
+            self.assertIn(schedule.status, ["optimal", "optimal_inaccurate"])
+            self.assertEqual(len(schedule.items), len(tasks))
+
+    def test_dynamic_programming_matches_milp(self):
+        """
+        Scenario:
+          - Random small instances with zero durations and ties in durations, deadlines and rewards.
+          - Checks that dynamic programming selects feasible tasks with the same total reward as HiGHS.
+        """
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            durations = rng.integers(0, 5, size=12)
+            deadlines = np.sort(rng.integers(0, 16, size=12))
+            rewards = rng.integers(0, 6, size=12)
+            horizon = min(int(durations.sum()), int(deadlines[-1]))
+
+            accepted = optimizer._solve_dp(durations, deadlines, rewards, horizon)
+            expected, status = optimizer._solve_highs(durations, deadlines, rewards, None)
+
+            self.assertEqual(status, "optimal")
+            self.assertTrue(np.all(np.cumsum(durations * accepted)[accepted] <= deadlines[accepted]))
+            self.assertEqual(rewards @ accepted, rewards @ expected)
+
+    def test_milp_matches_dynamic_programming(self):
+        """
+        Scenario:
+          - Random instances of 500 tasks, large enough for a nonzero MIP gap to change the result.
+          - Checks that HiGHS finds the same optimal reward as dynamic programming.
+        """
+        for seed in range(4):
+            rng = np.random.default_rng(seed)
+            durations = rng.integers(0, 10, size=500)
+            deadlines = np.sort(rng.integers(0, 1500, size=500))
+            rewards = rng.integers(1, 100, size=500)
+            horizon = min(int(durations.sum()), int(deadlines[-1]))
+
+            expected = optimizer._solve_dp(durations, deadlines, rewards, horizon)
+            accepted, status = optimizer._solve_highs(durations, deadlines, rewards, None)
+
+            self.assertEqual(status, "optimal")
+            self.assertEqual(rewards @ accepted, rewards @ expected)
+
+    def test_milp_rejects_hopeless_tasks(self):
+        """
+        Scenario:
+          - Tasks passed to the MILP directly, including one with a negative deadline
+            and a zero-duration one due before time 0.
+          - Checks that the model stays feasible and both tasks are rejected.
+        """
+        durations = np.array([1.0, 0.0, 2.5, 3.0])
+        deadlines = np.array([-1.0, -0.5, 5.0, 5.0])
+        rewards = np.array([1.0, 1.0, 2.0, 3.0])
+        accepted, status = optimizer._solve_highs(durations, deadlines, rewards, None)
+
+        self.assertEqual(status, "optimal")
+        np.testing.assert_array_equal(accepted, [False, False, False, True])
 
 if __name__ == "__main__":
     unittest.main()